@@ -2,17 +2,11 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 import json
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
-from io import BytesIO
 import base64
 from PIL import Image as PILImage
 import plotly.graph_objects as go
 import plotly.express as px
+from utils.pdf_generator import generate_pdf, read_pdf
 
 # Configuration de la page
 st.set_page_config(
@@ -154,111 +148,6 @@ L'équipe Déploiement Randstad
     """
     return email_content
 
-def generate_pdf(platform, client, siret, modules):
-    """Génère un PDF de procédure de déploiement"""
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4)
-    story = []
-    styles = getSampleStyleSheet()
-    
-    # Style personnalisé pour le titre
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#667eea'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    
-    # Titre
-    story.append(Paragraph(f"Procédure de Déploiement {platform}", title_style))
-    story.append(Spacer(1, 20))
-    
-    # Informations client
-    info_style = ParagraphStyle(
-        'InfoStyle',
-        parent=styles['Normal'],
-        fontSize=12,
-        spaceAfter=12
-    )
-    
-    story.append(Paragraph("<b>Informations Client</b>", styles['Heading2']))
-    story.append(Paragraph(f"<b>Nom:</b> {client}", info_style))
-    story.append(Paragraph(f"<b>SIRET:</b> {siret}", info_style))
-    story.append(Paragraph(f"<b>Date:</b> {datetime.now().strftime('%d/%m/%Y')}", info_style))
-    story.append(Spacer(1, 20))
-    
-    # Modules
-    story.append(Paragraph("<b>Modules à Déployer</b>", styles['Heading2']))
-    modules_data = [["Module", "Status", "Responsable"]]
-    for module in modules:
-        modules_data.append([module, "À déployer", "À assigner"])
-    
-    modules_table = Table(modules_data, colWidths=[200, 150, 150])
-    modules_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
-    story.append(modules_table)
-    story.append(Spacer(1, 30))
-    
-    # Étapes de déploiement
-    story.append(Paragraph("<b>Étapes de Déploiement</b>", styles['Heading2']))
-    steps = [
-        "1. Vérification des prérequis techniques",
-        "2. Création des environnements (Test/Production)",
-        "3. Configuration des modules sélectionnés",
-        "4. Import des données initiales",
-        "5. Création des comptes utilisateurs",
-        "6. Tests de validation",
-        "7. Formation des utilisateurs clés",
-        "8. Mise en production",
-        "9. Support post-déploiement (2 semaines)"
-    ]
-    
-    for step in steps:
-        story.append(Paragraph(step, info_style))
-    
-    story.append(PageBreak())
-    
-    # Checklist
-    story.append(Paragraph("<b>Checklist de Déploiement</b>", styles['Heading2']))
-    checklist_data = [
-        ["Tâche", "Complété", "Date", "Responsable"],
-        ["Environnement de test créé", "☐", "", ""],
-        ["Modules configurés", "☐", "", ""],
-        ["Données importées", "☐", "", ""],
-        ["Utilisateurs créés", "☐", "", ""],
-        ["Tests validés", "☐", "", ""],
-        ["Formation effectuée", "☐", "", ""],
-        ["Go-Live approuvé", "☐", "", ""],
-    ]
-    
-    checklist_table = Table(checklist_data, colWidths=[200, 60, 100, 140])
-    checklist_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#764ba2')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
-    story.append(checklist_table)
-    
-    # Build PDF
-    doc.build(story)
-    buffer.seek(0)
-    return buffer
-
 # Interface principale
 st.markdown('<div class="main-header"><h1>🚀 Gestion des Déploiements</h1><p>Plateforme de génération automatique de documents</p></div>', unsafe_allow_html=True)
 
@@ -350,7 +239,12 @@ with col2:
     if st.button("📄 Générer PDF", use_container_width=True):
         if client_name and siret and modules:
             pdf_buffer = generate_pdf(platform, client_name, siret, modules)
+            
+            # Libérer le PDF précédent (supprime son fichier temporaire éventuel)
+            if 'pdf_buffer' in st.session_state:
+                st.session_state.pdf_buffer.close()
             st.session_state.pdf_buffer = pdf_buffer
+            st.session_state.pdf_ready_for = None
             
             # Ajouter au historique
             st.session_state.deployments.append({
@@ -365,6 +259,9 @@ with col2:
         else:
             st.error("⚠️ Veuillez remplir tous les champs")
 
+def prepare_pdf_download(inputs):
+    st.session_state.pdf_ready_for = inputs
+
 # Zone d'affichage des résultats
 st.markdown("---")
 
@@ -387,14 +284,30 @@ with col_results2:
         # Aperçu (simulé)
         st.info("📋 Le PDF contient:\n- Page de garde\n- Informations client\n- Liste des modules\n- Procédure détaillée\n- Checklist de validation")
         
-        # Bouton de téléchargement
-        st.download_button(
-            label="⬇️ Télécharger le PDF",
-            data=st.session_state.pdf_buffer,
-            file_name=f"deploiement_{platform}_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
-            mime="application/pdf",
-            use_container_width=True
-        )
+        # Le PDF n'est relu et envoyé au navigateur qu'à la demande. La
+        # préparation est annulée dès qu'un PDF est régénéré ou qu'un champ
+        # du formulaire change.
+        pdf_inputs = (platform, client_name, siret, tuple(modules))
+        pdf_data = None
+        if st.session_state.get('pdf_ready_for') == pdf_inputs:
+            pdf_data = read_pdf(st.session_state.pdf_buffer)
+        
+        if pdf_data is not None:
+            # Bouton de téléchargement
+            st.download_button(
+                label="⬇️ Télécharger le PDF",
+                data=pdf_data,
+                file_name=f"deploiement_{platform}_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
+                mime="application/pdf",
+                use_container_width=True
+            )
+        else:
+            st.button(
+                "📦 Préparer le téléchargement",
+                on_click=prepare_pdf_download,
+                args=(pdf_inputs,),
+                use_container_width=True
+            )
 
 # Historique des déploiements
 if st.session_state.deployments:
@@ -0,0 +1,21 @@
+from utils.pdf_generator import generate_pdf, read_pdf
+
+
+def test_generate_pdf_returns_readable_pdf_in_memory():
+    buffer = generate_pdf("Baps", "Client", "123 456 789 00012", ["Commandes", "Heures"])
+    data = read_pdf(buffer)
+    assert data.startswith(b"%PDF")
+    assert data.rstrip().endswith(b"%%EOF")
+    assert buffer.name is None
+
+
+def test_generate_pdf_spools_to_disk_above_max_size():
+    buffer = generate_pdf("Baps", "Client", "123 456 789 00012", ["Commandes"], max_size=1024)
+    assert buffer.name is not None
+    assert read_pdf(buffer).startswith(b"%PDF")
+
+
+def test_read_pdf_closed_buffer_returns_none():
+    buffer = generate_pdf("Baps", "Client", "123 456 789 00012", ["Commandes"])
+    buffer.close()
+    assert read_pdf(buffer) is None
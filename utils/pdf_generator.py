@@ -0,0 +1,132 @@
+from datetime import datetime
+from tempfile import SpooledTemporaryFile
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.enums import TA_CENTER
+
+# Taille maximale (octets) d'un PDF gardé en mémoire avant écriture sur disque
+PDF_SPOOL_MAX_SIZE = 1024 * 1024
+
+def generate_pdf(platform, client, siret, modules, max_size=PDF_SPOOL_MAX_SIZE):
+    """Génère un PDF de procédure de déploiement
+
+    Le document est écrit dans un fichier temporaire qui bascule sur disque
+    au-delà de max_size octets au lieu de rester en mémoire dans la session.
+    Ce fichier est anonyme : il disparaît à la fermeture du tampon, y
+    compris quand la session expire.
+    """
+    buffer = SpooledTemporaryFile(max_size=max_size)
+    doc = SimpleDocTemplate(buffer, pagesize=A4)
+    story = []
+    styles = getSampleStyleSheet()
+    
+    # Style personnalisé pour le titre
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#667eea'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+    
+    # Titre
+    story.append(Paragraph(f"Procédure de Déploiement {platform}", title_style))
+    story.append(Spacer(1, 20))
+    
+    # Informations client
+    info_style = ParagraphStyle(
+        'InfoStyle',
+        parent=styles['Normal'],
+        fontSize=12,
+        spaceAfter=12
+    )
+    
+    story.append(Paragraph("<b>Informations Client</b>", styles['Heading2']))
+    story.append(Paragraph(f"<b>Nom:</b> {client}", info_style))
+    story.append(Paragraph(f"<b>SIRET:</b> {siret}", info_style))
+    story.append(Paragraph(f"<b>Date:</b> {datetime.now().strftime('%d/%m/%Y')}", info_style))
+    story.append(Spacer(1, 20))
+    
+    # Modules
+    story.append(Paragraph("<b>Modules à Déployer</b>", styles['Heading2']))
+    modules_data = [["Module", "Status", "Responsable"]]
+    for module in modules:
+        modules_data.append([module, "À déployer", "À assigner"])
+    
+    modules_table = Table(modules_data, colWidths=[200, 150, 150])
+    modules_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    story.append(modules_table)
+    story.append(Spacer(1, 30))
+    
+    # Étapes de déploiement
+    story.append(Paragraph("<b>Étapes de Déploiement</b>", styles['Heading2']))
+    steps = [
+        "1. Vérification des prérequis techniques",
+        "2. Création des environnements (Test/Production)",
+        "3. Configuration des modules sélectionnés",
+        "4. Import des données initiales",
+        "5. Création des comptes utilisateurs",
+        "6. Tests de validation",
+        "7. Formation des utilisateurs clés",
+        "8. Mise en production",
+        "9. Support post-déploiement (2 semaines)"
+    ]
+    
+    for step in steps:
+        story.append(Paragraph(step, info_style))
+    
+    story.append(PageBreak())
+    
+    # Checklist
+    story.append(Paragraph("<b>Checklist de Déploiement</b>", styles['Heading2']))
+    checklist_data = [
+        ["Tâche", "Complété", "Date", "Responsable"],
+        ["Environnement de test créé", "☐", "", ""],
+        ["Modules configurés", "☐", "", ""],
+        ["Données importées", "☐", "", ""],
+        ["Utilisateurs créés", "☐", "", ""],
+        ["Tests validés", "☐", "", ""],
+        ["Formation effectuée", "☐", "", ""],
+        ["Go-Live approuvé", "☐", "", ""],
+    ]
+    
+    checklist_table = Table(checklist_data, colWidths=[200, 60, 100, 140])
+    checklist_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#764ba2')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    story.append(checklist_table)
+    
+    # Build PDF
+    doc.build(story)
+    buffer.seek(0)
+    return buffer
+
+def read_pdf(buffer):
+    """Relit le contenu d'un PDF généré (mémoire ou fichier temporaire)
+
+    Retourne None si le tampon a déjà été fermé (PDF remplacé entre-temps).
+    """
+    try:
+        buffer.seek(0)
+        return buffer.read()
+    except ValueError:
+        return None